@@ -11,11 +11,30 @@ cryptographic hashes (SHA256/SHA512), and comprehensive legal summaries.
 
 import os
 import csv
+import fnmatch
 import hashlib
+import logging
+import mmap
+import operator
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Read buffer for hashing; large reads amortize syscall and update() overhead
+# (two are allocated per streamed file for read-ahead)
+HASH_BUFFER_SIZE = 1 << 20
+
+# Write buffer for CSV output; fewer, larger write() calls for big registers
+CSV_BUFFER_SIZE = 1 << 20
+
+# Files up to this size are memory-mapped and hashed without a Python loop
+MMAP_HASH_LIMIT = 256 << 20
 
 
 class EvidenceRegister:
@@ -48,40 +67,209 @@ class EvidenceRegister:
         "Fully detail clean OCR"
     ]
     
-    def __init__(self, base_path: str = "."):
-        """Initialize the evidence register system."""
+    # Filename parsing patterns, compiled once at class load
+    _MSGID_RE = re.compile(r' - ([^-]+@[^.]+(?:\.[^.]+)*?)\.pdf$')
+    _MSGID_SUFFIX_RE = re.compile(r' - [^-]+@[^@]+$')
+    
+    # Category keywords (matched against lowercased text) and the
+    # (category, filename keywords, subject keywords) rules they feed,
+    # in priority order
+    _CATEGORY_RE = re.compile(
+        r'(?=(receipt|agreement|contract|vcat|order|notice|maintenance|repair|payment|exhibit|medical))'
+    )
+    _CATEGORY_RULES = (
+        ("Receipt", frozenset({"receipt"}), frozenset({"receipt"})),
+        ("Legal", frozenset({"agreement", "contract"}), frozenset()),
+        ("VCAT Document", frozenset({"vcat"}), frozenset({"vcat"})),
+        ("Court Order", frozenset({"order"}), frozenset({"order"})),
+        ("Notice", frozenset({"notice"}), frozenset({"notice"})),
+        ("Maintenance", frozenset(), frozenset({"maintenance", "repair"})),
+        ("Payment", frozenset(), frozenset({"payment"})),
+        ("Exhibit", frozenset({"exhibit"}), frozenset()),
+        ("Medical", frozenset({"medical"}), frozenset()),
+    )
+    
+    def __init__(self, base_path: str = ".", strict: bool = False,
+                 workers: Optional[int] = None, include_sha512: bool = False):
+        """
+        Initialize the evidence register system.
+        
+        Args:
+            base_path: Directory containing evidence documents
+            strict: Also check EVID ID, ID and file_number uniqueness for the
+                IDs process_all_documents generates; rows with caller-supplied
+                IDs are always fully validated
+            workers: Number of worker processes for process_all_documents and
+                hashing threads for batch_hash (default: CPU count; 1 processes
+                and hashes documents one at a time in-process)
+            include_sha512: Also compute SHA512 hashes (SHA256 only by default)
+        """
         self.base_path = Path(base_path)
-        self.evidence_items: List[Dict] = []
+        self.strict = strict
+        self.workers = workers
+        self.include_sha512 = include_sha512
+        # Evidence rows stored column-wise, one list per CSV column
+        self.columns: Dict[str, List] = {col: [] for col in self.CSV_COLUMNS}
+        self._items_cache: Optional[Tuple[Mapping[str, object], ...]] = None
         self.seen_evid_ids: Set[int] = set()
         self.seen_filenames: Set[str] = set()
         self.seen_ids: Set[int] = set()
         self.seen_file_numbers: Set[int] = set()
         
-    def compute_hashes(self, filepath: Path) -> Tuple[str, str]:
+    def __len__(self) -> int:
+        """Number of evidence rows in the register."""
+        return len(self.columns["EVID ID"])
+    
+    @property
+    def evidence_items(self) -> Tuple[Mapping[str, object], ...]:
+        """
+        Evidence rows as read-only mappings keyed by CSV column.
+        
+        This used to be a mutable list; it is now an immutable view of the
+        column storage, so add rows with add_evidence_row instead. The view
+        is built once and reused until the next add_evidence_row call.
+        """
+        if self._items_cache is None:
+            self._items_cache = tuple(
+                MappingProxyType(dict(zip(self.CSV_COLUMNS, row)))
+                for row in zip(*self.columns.values())
+            )
+        return self._items_cache
+    
+    def add_evidence_row(self, evidence_data: Dict) -> None:
+        """
+        Append a validated evidence row to the column storage.
+        
+        The row is checked before anything is appended, so a rejected row
+        never leaves the columns out of step with each other.
+        
+        Args:
+            evidence_data: Dictionary containing evidence metadata
+            
+        Raises:
+            ValueError: If the row's keys don't match CSV_COLUMNS
+        """
+        if evidence_data.keys() != self.columns.keys():
+            missing = [col for col in self.CSV_COLUMNS if col not in evidence_data]
+            extra = [key for key in evidence_data if key not in self.columns]
+            raise ValueError(
+                f"Evidence row columns don't match CSV_COLUMNS "
+                f"(missing: {missing}, unexpected: {extra})"
+            )
+        
+        values = [evidence_data[col] for col in self.CSV_COLUMNS]
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+        self._items_cache = None
+    
+    def compute_hashes(self, filepath: Union[Path, BinaryIO]) -> Tuple[str, str]:
         """
         Compute SHA256 and SHA512 hashes for a file.
         
+        SHA512 is only computed when include_sha512 is set.
+        
         Args:
-            filepath: Path to the file
+            filepath: Path to the file, or a binary file object to hash from
+                its current position
             
         Returns:
-            Tuple of (SHA256 hex digest, SHA512 hex digest)
+            Tuple of (SHA256 hex digest, SHA512 hex digest or empty string)
         """
-        sha256_hash = hashlib.sha256()
-        sha512_hash = hashlib.sha512()
-        
         try:
-            with open(filepath, "rb") as f:
-                # Read file in chunks to handle large files efficiently
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256_hash.update(chunk)
-                    sha512_hash.update(chunk)
+            # Already-open file objects (e.g. io.BytesIO) are streamed as-is
+            if not isinstance(filepath, (str, os.PathLike)):
+                return self._hash_stream(filepath)
             
-            return sha256_hash.hexdigest(), sha512_hash.hexdigest()
+            with open(filepath, "rb", buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                
+                # Map small and medium files and hash them in a single call
+                if 0 < size <= MMAP_HASH_LIMIT:
+                    try:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        pass  # Not mappable; fall back to streaming
+                    else:
+                        with mapped:
+                            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                            sha256 = hashlib.sha256(mapped).hexdigest()
+                            if not self.include_sha512:
+                                return sha256, ""
+                            return sha256, hashlib.sha512(mapped).hexdigest()
+                
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                return self._hash_stream(f)
         except Exception as e:
-            print(f"Warning: Could not compute hashes for {filepath}: {e}")
+            logger.warning(f"Could not compute hashes for {filepath}: {e}")
             return "", ""
     
+    def _hash_stream(self, f) -> Tuple[str, str]:
+        """
+        Compute SHA256 and SHA512 hashes by streaming a binary file object.
+        
+        Args:
+            f: Binary file object supporting readinto()
+            
+        Returns:
+            Tuple of (SHA256 hex digest, SHA512 hex digest or empty string)
+        """
+        sha256_hash = hashlib.sha256()
+        sha512_hash = hashlib.sha512() if self.include_sha512 else None
+        
+        # Double-buffer large chunks: a reader thread fills one buffer while
+        # the other is hashed (hashlib releases the GIL during update())
+        buffers = (memoryview(bytearray(HASH_BUFFER_SIZE)),
+                   memoryview(bytearray(HASH_BUFFER_SIZE)))
+        current = 0
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(f.readinto, buffers[current])
+            while True:
+                n = pending.result()
+                if not n:
+                    break
+                chunk = buffers[current][:n]
+                current ^= 1
+                pending = reader.submit(f.readinto, buffers[current])
+                sha256_hash.update(chunk)
+                if sha512_hash is not None:
+                    sha512_hash.update(chunk)
+        
+        return sha256_hash.hexdigest(), sha512_hash.hexdigest() if sha512_hash is not None else ""
+    
+    def batch_hash(self, paths: List[Path],
+                   stats: Optional[Dict[Path, os.stat_result]] = None
+                   ) -> Dict[Path, Tuple[str, str]]:
+        """
+        Compute SHA256 and SHA512 hashes for many files in parallel.
+        
+        Files are submitted largest first so the biggest files don't end
+        up as a long serial tail once the smaller ones have finished.
+        
+        Standalone helper: process_all_documents hashes each file inside
+        the worker process that builds its row instead.
+        
+        Args:
+            paths: Paths to the files
+            stats: Known stat results by path, used to avoid re-stat'ing
+            
+        Returns:
+            Dictionary mapping each path to its (SHA256, SHA512) hex digests
+        """
+        def size_of(path: Path) -> int:
+            st = stats.get(path) if stats else None
+            if st is not None:
+                return st.st_size
+            try:
+                return path.stat().st_size
+            except OSError:
+                return 0
+        
+        ordered = sorted(paths, key=size_of, reverse=True)
+        with ThreadPoolExecutor(max_workers=self.workers or os.cpu_count()) as executor:
+            return dict(zip(ordered, executor.map(self.compute_hashes, ordered)))
+    
     def extract_date_from_filename(self, filename: str) -> str:
         """
         Extract and format date from filename.
@@ -92,18 +280,12 @@ class EvidenceRegister:
         Returns:
             Formatted date string (YYYY-MM-DD) or empty string
         """
-        # Pattern: YYMMDD at start of filename
-        match = re.match(r'^(\d{6})', filename)
-        if match:
-            date_str = match.group(1)
-            try:
-                # Parse as YYMMDD (20YYMMDD for 2000s)
-                year = int("20" + date_str[0:2])
-                month = int(date_str[2:4])
-                day = int(date_str[4:6])
-                return f"{year:04d}-{month:02d}-{day:02d}"
-            except (ValueError, IndexError):
-                pass
+        # Pattern: YYMMDD at start of filename (20YYMMDD for 2000s)
+        date_str = filename[:6]
+        if len(date_str) == 6 and date_str.isascii() and date_str.isdigit():
+            year, month, day = date_str[0:2], date_str[2:4], date_str[4:6]
+            if '01' <= month <= '12' and '01' <= day <= '31':
+                return f"20{year}-{month}-{day}"
         
         return ""
     
@@ -119,7 +301,7 @@ class EvidenceRegister:
         """
         # Look for pattern: text - MessageID@domain.pdf
         # MessageID is typically between last '-' and '@' or '.pdf'
-        match = re.search(r' - ([^-]+@[^.]+(?:\.[^.]+)*?)\.pdf$', filename)
+        match = self._MSGID_RE.search(filename)
         if match:
             return match.group(1).strip()
         
@@ -161,122 +343,103 @@ class EvidenceRegister:
         name_without_ext = filename.rsplit('.', 1)[0]
         
         # Remove date prefix (YYMMDD - )
-        subject = re.sub(r'^\d{6} - ', '', name_without_ext)
+        subject = name_without_ext
+        date_str = subject[:6]
+        if (len(date_str) == 6 and date_str.isascii() and date_str.isdigit()
+                and subject[6:9] == ' - '):
+            subject = subject[9:]
         
         # Remove message ID suffix if present
-        subject = re.sub(r' - [^-]+@[^@]+$', '', subject)
+        subject = self._MSGID_SUFFIX_RE.sub('', subject)
         
         return subject.strip()
     
-    def get_file_size_kb(self, filepath: Path) -> int:
+    def get_file_size_kb(self, st: Optional[os.stat_result]) -> int:
         """
         Get file size in kilobytes.
         
         Args:
-            filepath: Path to the file
+            st: Stat result for the file, or None if it could not be read
             
         Returns:
             File size in KB (rounded to nearest integer)
         """
-        try:
-            size_bytes = filepath.stat().st_size
-            return round(size_bytes / 1024)
-        except Exception as e:
-            print(f"Warning: Could not get file size for {filepath}: {e}")
+        if st is None:
             return 0
+        return round(st.st_size / 1024)
     
-    def get_modified_date(self, filepath: Path) -> str:
+    def get_modified_date(self, st: Optional[os.stat_result]) -> str:
         """
         Get file modification timestamp.
         
         Args:
-            filepath: Path to the file
+            st: Stat result for the file, or None if it could not be read
             
         Returns:
             ISO 8601 formatted datetime string
         """
+        if st is None:
+            return ""
         try:
-            mtime = filepath.stat().st_mtime
-            dt = datetime.fromtimestamp(mtime)
+            dt = datetime.fromtimestamp(st.st_mtime)
             return dt.strftime("%Y-%m-%dT%H:%M:%S")
-        except Exception as e:
-            print(f"Warning: Could not get modified date for {filepath}: {e}")
+        except (OverflowError, OSError, ValueError) as e:
+            logger.warning(f"Could not get modified date ({st.st_mtime}): {e}")
             return ""
     
-    def generate_ocr_summary(self, evidence_data: Dict) -> str:
+    def generate_ocr_summary(self, filename: str, file_size: int = 0,
+                             date_formatted: str = "", subject: str = "",
+                             category: str = "Document", message_id: str = "",
+                             email: str = "", domain: str = "",
+                             sha256: str = "", sha512: str = "",
+                             storage_path: str = "Root",
+                             evid_id: Optional[int] = None,
+                             modified_a: str = "") -> str:
         """
         Generate comprehensive "Fully detail clean OCR" summary.
         
         Args:
-            evidence_data: Dictionary containing evidence metadata
+            filename: The filename
+            file_size: File size in KB
+            date_formatted: Formatted document date
+            subject: The document subject
+            category: Document category
+            message_id: Email Message ID
+            email: Email address
+            domain: Email domain
+            sha256: SHA256 hex digest
+            sha512: SHA512 hex digest
+            storage_path: Storage location
+            evid_id: Evidence ID number
+            modified_a: Last modification timestamp
             
         Returns:
             Detailed semicolon-separated summary string
         """
-        parts = []
-        
-        # Document identification
-        filename = evidence_data.get('Filename', '')
-        parts.append(f"Document filename: '{filename}'")
-        
-        # File properties
-        file_size = evidence_data.get('File Size (KB)', '')
-        if file_size:
-            parts.append(f"File size: {file_size} KB")
-        
-        # Date information
-        date_formatted = evidence_data.get('Date Formatted', '')
-        if date_formatted:
-            parts.append(f"Document date: {date_formatted}")
-        
-        # Subject/Content
-        subject = evidence_data.get('Subject', '')
-        if subject:
-            parts.append(f"Subject: {subject}")
-        
-        # Category classification
-        category = evidence_data.get('file_category', 'Document')
-        parts.append(f"Categorized as: {category}")
-        
-        # Email metadata
-        message_id = evidence_data.get('Message ID', '')
-        email = evidence_data.get('Email Address', '')
-        domain = evidence_data.get('Domain', '')
-        if message_id:
-            parts.append(f"Email Message ID: {message_id}")
-        if email:
-            parts.append(f"Email address: {email}")
-        if domain:
-            parts.append(f"Email domain: {domain}")
-        
-        # Cryptographic authentication
-        sha256 = evidence_data.get('SHA256', '')
-        sha512 = evidence_data.get('SHA512', '')
-        if sha256:
-            parts.append(f"SHA256 hash: {sha256}")
-        if sha512:
-            parts.append(f"SHA512 hash: {sha512}")
-        
-        # Storage and tracking
-        storage_path = evidence_data.get('storage_path', 'Root')
-        parts.append(f"Storage location: {storage_path}")
-        
-        evid_id = evidence_data.get('EVID ID', '')
-        if evid_id:
-            parts.append(f"Evidence ID: {evid_id}")
-        
-        # Modification tracking
-        modified_a = evidence_data.get('Modified (A)', '')
-        modified_b = evidence_data.get('Modified (B)', '')
-        if modified_a:
-            parts.append(f"Last modified: {modified_a}")
-        
-        # Legal suitability statement
-        parts.append("Document integrity verified through cryptographic hashing")
-        parts.append("Evidence is authenticated and suitable for inclusion in legal proceedings as an exhibit")
-        parts.append("Chain of custody maintained; document is legally admissible subject to tribunal rules")
-        
-        return "; ".join(parts)
+        return (
+            # Document identification and file properties
+            f"Document filename: '{filename}'"
+            + (f"; File size: {file_size} KB" if file_size else "")
+            + (f"; Document date: {date_formatted}" if date_formatted else "")
+            + (f"; Subject: {subject}" if subject else "")
+            # Category classification
+            + f"; Categorized as: {category}"
+            # Email metadata
+            + (f"; Email Message ID: {message_id}" if message_id else "")
+            + (f"; Email address: {email}" if email else "")
+            + (f"; Email domain: {domain}" if domain else "")
+            # Cryptographic authentication
+            + (f"; SHA256 hash: {sha256}" if sha256 else "")
+            + (f"; SHA512 hash: {sha512}" if sha512 else "")
+            # Storage, tracking and modification
+            + f"; Storage location: {storage_path}"
+            + (f"; Evidence ID: {evid_id}" if evid_id else "")
+            + (f"; Last modified: {modified_a}" if modified_a else "")
+            # Legal suitability statement
+            + "; Document integrity verified through cryptographic hashing"
+            "; Evidence is authenticated and suitable for inclusion in legal proceedings as an exhibit"
+            "; Chain of custody maintained; document is legally admissible subject to tribunal rules"
+        )
     
     def categorize_document(self, filename: str, subject: str) -> str:
         """
@@ -289,30 +452,30 @@ class EvidenceRegister:
         Returns:
             Document category string
         """
-        filename_lower = filename.lower()
-        subject_lower = subject.lower()
-        
-        # Category detection patterns
-        if 'receipt' in filename_lower or 'receipt' in subject_lower:
-            return "Receipt"
-        elif 'agreement' in filename_lower or 'contract' in filename_lower:
-            return "Legal"
-        elif 'vcat' in filename_lower or 'vcat' in subject_lower:
-            return "VCAT Document"
-        elif 'order' in filename_lower or 'order' in subject_lower:
-            return "Court Order"
-        elif 'notice' in filename_lower or 'notice' in subject_lower:
-            return "Notice"
-        elif 'maintenance' in subject_lower or 'repair' in subject_lower:
-            return "Maintenance"
-        elif 'payment' in subject_lower:
-            return "Payment"
-        elif 'exhibit' in filename_lower:
-            return "Exhibit"
-        elif 'medical' in filename_lower:
-            return "Medical"
-        else:
-            return "Document"
+        return self._categorize_lower(filename.lower(), subject.lower())
+    
+    def _categorize_lower(self, filename_lower: str, subject_lower: str) -> str:
+        """
+        Categorize document based on already-lowercased filename and subject.
+        
+        Args:
+            filename_lower: The lowercased filename
+            subject_lower: The lowercased document subject
+            
+        Returns:
+            Document category string
+        """
+        # Scan each field once for every keyword (lookahead so overlapping
+        # keywords are all found), then resolve by rule priority
+        filename_keywords = set(self._CATEGORY_RE.findall(filename_lower))
+        subject_keywords = set(self._CATEGORY_RE.findall(subject_lower))
+        
+        if filename_keywords or subject_keywords:
+            for category, in_filename, in_subject in self._CATEGORY_RULES:
+                if filename_keywords & in_filename or subject_keywords & in_subject:
+                    return category
+        
+        return "Document"
     
     def validate_evidence_row(self, evidence_data: Dict) -> Tuple[bool, str]:
         """
@@ -372,52 +535,99 @@ class EvidenceRegister:
         
         return True, ""
     
-    def process_document(self, filepath: Path, evid_id: int, id_num: int, 
-                        file_number: int) -> Optional[Dict]:
+    def _fast_validate(self, evidence_data: Dict) -> Tuple[bool, str]:
         """
-        Process a single document and collect all metadata.
+        Validate an evidence row whose IDs come from the sequential generator.
         
-        Evidence Row Checklist:
-        1. Gather all possible metadata and source details
-        2. EVID ID and Filename must be unique and definite
-        3. Default file_category to 'Document' if undetermined
-        4. Populate Message ID, Domain, and Email Address if relevant
-        5. storage_path must be completed; if not specified, use 'Root'
-        6. Satisfy compliance, authentication, traceability criteria
-        7. Generate 'Fully detail clean OCR' summary
-        8. Validate column presence, order, uniqueness, and RFC4180 correctness
+        Generated IDs are unique by construction, so only their type is
+        checked; Filename uniqueness and column count are still enforced.
+        
+        Args:
+            evidence_data: Dictionary containing evidence metadata
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        for field in ("EVID ID", "ID", "file_number"):
+            value = evidence_data.get(field)
+            if not value:
+                return False, f"Missing {field}"
+            if isinstance(value, bool) or not isinstance(value, int):
+                return False, f"Invalid {field} (not an integer): {value}"
+        
+        filename = evidence_data.get('Filename')
+        if not filename:
+            return False, "Missing Filename"
+        if filename in self.seen_filenames:
+            return False, f"Duplicate Filename: {filename}"
+        
+        if len(evidence_data) != len(self.CSV_COLUMNS):
+            return False, f"Column count mismatch: expected {len(self.CSV_COLUMNS)}, got {len(evidence_data)}"
+        
+        return True, ""
+    
+    def build_evidence_row(self, filepath: Path, evid_id: int, id_num: int,
+                           file_number: int,
+                           hashes: Optional[Tuple[str, str]] = None,
+                           st: Optional[os.stat_result] = None) -> Dict:
+        """
+        Collect all metadata for a single document into an evidence row.
+        
+        Only reads the file and the register's configuration, never its
+        seen_* state, so rows can be built in worker processes and
+        validated afterwards.
         
         Args:
             filepath: Path to the document file
             evid_id: Evidence ID number
             id_num: ID number
             file_number: File number
+            hashes: Precomputed (SHA256, SHA512) tuple; computed here if omitted
+            st: Precomputed stat result; the file is stat'ed once here if omitted
             
         Returns:
-            Dictionary containing evidence metadata or None if validation fails
+            Dictionary containing evidence metadata (not yet validated)
         """
-        print(f"\nProcessing: {filepath.name}")
-        print("Step 1/6: Collecting metadata...")
+        logger.info(f"\nProcessing: {filepath.name}")
+        logger.debug("Step 1/6: Collecting metadata...")
         
         filename = filepath.name
+        filename_lower = filename.lower()
         
         # Step 1: Collect all metadata
         date_formatted = self.extract_date_from_filename(filename)
         subject = self.extract_subject(filename)
         message_id = self.extract_message_id(filename)
         domain, email_address = self.extract_domain_and_email(message_id)
-        file_size_kb = self.get_file_size_kb(filepath)
-        modified_date = self.get_modified_date(filepath)
+        if st is None:
+            try:
+                st = filepath.stat()
+            except OSError as e:
+                logger.warning(f"Could not stat {filepath}: {e}")
+        file_size_kb = self.get_file_size_kb(st)
+        modified_date = self.get_modified_date(st)
         
-        print("Step 2/6: Computing cryptographic hashes...")
-        sha256, sha512 = self.compute_hashes(filepath)
+        logger.debug("Step 2/6: Computing cryptographic hashes...")
+        if hashes is None:
+            hashes = self.compute_hashes(filepath)
+        sha256, sha512 = hashes
         
-        print("Step 3/6: Determining file category...")
-        file_category = self.categorize_document(filename, subject)
+        logger.debug("Step 3/6: Determining file category...")
+        file_category = self._categorize_lower(filename_lower, subject.lower())
         
         # Step 2: Verify critical values
-        print("Step 4/6: Verifying critical values...")
-        evidence_data = {
+        logger.debug("Step 4/6: Verifying critical values...")
+        storage_path = "Root"  # Default to Root
+        
+        # Step 3: Generate legally compliant summary
+        logger.debug("Step 5/6: Generating legal summary...")
+        ocr_summary = self.generate_ocr_summary(
+            filename, file_size_kb, date_formatted, subject, file_category,
+            message_id, email_address, domain, sha256, sha512, storage_path,
+            evid_id, modified_date
+        )
+        
+        return {
             "EVID ID": evid_id,
             "Filename": filename,
             "Date Formatted": date_formatted,
@@ -430,35 +640,119 @@ class EvidenceRegister:
             "SHA512": sha512,
             "file_category": file_category,
             "Raw URL": "",  # Can be populated if URLs are provided
-            "storage_path": "Root",  # Default to Root
+            "storage_path": storage_path,
             "ID": id_num,
             "file_number": file_number,
             "Modified (A)": modified_date,
             "Modified (B)": modified_date,
-            "Fully detail clean OCR": ""  # Will be generated next
+            "Fully detail clean OCR": ocr_summary
         }
+    
+    def accept_evidence_row(self, evidence_data: Dict,
+                            ids_generated: bool = False) -> bool:
+        """
+        Validate an evidence row and record its identifiers as seen.
         
-        # Step 3: Generate legally compliant summary
-        print("Step 5/6: Generating legal summary...")
-        evidence_data["Fully detail clean OCR"] = self.generate_ocr_summary(evidence_data)
-        
+        Args:
+            evidence_data: Dictionary containing evidence metadata
+            ids_generated: The row's EVID ID, ID and file_number come from
+                process_all_documents' sequential generator, so their
+                uniqueness checks may be skipped unless strict is set
+            
+        Returns:
+            True if the row passed validation, False otherwise
+        """
         # Step 4-5: Validate unique identifiers and finalize format
-        print("Step 6/6: Validating row format and compliance...")
-        is_valid, error_msg = self.validate_evidence_row(evidence_data)
+        logger.debug("Step 6/6: Validating row format and compliance...")
+        if ids_generated and not self.strict:
+            is_valid, error_msg = self._fast_validate(evidence_data)
+        else:
+            is_valid, error_msg = self.validate_evidence_row(evidence_data)
         
         if not is_valid:
-            print(f"❌ VALIDATION FAILED: {error_msg}")
-            return None
+            logger.warning(f"❌ VALIDATION FAILED: {error_msg}")
+            return False
         
         # Mark IDs as seen
-        self.seen_evid_ids.add(int(evid_id))
-        self.seen_filenames.add(filename)
-        self.seen_ids.add(int(id_num))
-        self.seen_file_numbers.add(int(file_number))
+        self.seen_filenames.add(evidence_data["Filename"])
+        self.seen_evid_ids.add(int(evidence_data["EVID ID"]))
+        self.seen_ids.add(int(evidence_data["ID"]))
+        self.seen_file_numbers.add(int(evidence_data["file_number"]))
+        
+        logger.debug("✓ VALIDATION PASSED: Row compliant and ready")
+        return True
+    
+    def process_document(self, filepath: Path, evid_id: int, id_num: int, 
+                        file_number: int,
+                        hashes: Optional[Tuple[str, str]] = None,
+                        st: Optional[os.stat_result] = None,
+                        ids_generated: bool = False) -> Optional[Dict]:
+        """
+        Process a single document and collect all metadata.
+        
+        Evidence Row Checklist:
+        1. Gather all possible metadata and source details
+        2. EVID ID and Filename must be unique and definite
+        3. Default file_category to 'Document' if undetermined
+        4. Populate Message ID, Domain, and Email Address if relevant
+        5. storage_path must be completed; if not specified, use 'Root'
+        6. Satisfy compliance, authentication, traceability criteria
+        7. Generate 'Fully detail clean OCR' summary
+        8. Validate column presence, order, uniqueness, and RFC4180 correctness
+        
+        Args:
+            filepath: Path to the document file
+            evid_id: Evidence ID number
+            id_num: ID number
+            file_number: File number
+            hashes: Precomputed (SHA256, SHA512) tuple; computed here if omitted
+            st: Precomputed stat result; the file is stat'ed once here if omitted
+            ids_generated: The IDs come from process_all_documents' sequential
+                generator (see accept_evidence_row)
+            
+        Returns:
+            Dictionary containing evidence metadata or None if validation fails
+        """
+        evidence_data = self.build_evidence_row(
+            filepath, evid_id, id_num, file_number, hashes, st
+        )
+        
+        if not self.accept_evidence_row(evidence_data, ids_generated):
+            return None
         
-        print(f"✓ VALIDATION PASSED: Row compliant and ready")
         return evidence_data
     
+    def _find_documents(self, pattern: str
+                        ) -> List[Tuple[Path, Optional[os.stat_result]]]:
+        """
+        List files in the base directory matching the pattern.
+        
+        Uses os.scandir so the directory listing's cached entry types and
+        stat results are reused rather than re-stat'ing every path.
+        
+        Args:
+            pattern: File pattern to match
+            
+        Returns:
+            Sorted list of (path, stat result) tuples
+        """
+        # Patterns reaching into subdirectories need full glob semantics
+        if '/' in pattern or os.sep in pattern:
+            return [(path, None) for path in sorted(self.base_path.glob(pattern))]
+        
+        documents = []
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        st = None
+                    documents.append((Path(entry.path), st))
+        
+        documents.sort(key=lambda document: document[0])
+        return documents
+    
     def process_all_documents(self, pattern: str = "*.pdf") -> None:
         """
         Process all documents matching the pattern.
@@ -466,40 +760,74 @@ class EvidenceRegister:
         Args:
             pattern: File pattern to match (default: *.pdf)
         """
-        print("=" * 80)
-        print("EVIDENCE REGISTER SYSTEM - DOCUMENT PROCESSING")
-        print("=" * 80)
-        print("\nEvidence Row Checklist:")
-        print("1. Collect all metadata and source details")
-        print("2. Verify EVID ID and Filename are unique")
-        print("3. Validate critical values")
-        print("4. Generate legally compliant summary")
-        print("5. Validate unique identifiers")
-        print("6. Finalize row format")
-        print("7. Ensure RFC4180 compliance")
-        print("=" * 80)
+        logger.info("=" * 80)
+        logger.info("EVIDENCE REGISTER SYSTEM - DOCUMENT PROCESSING")
+        logger.info("=" * 80)
+        logger.info("\nEvidence Row Checklist:")
+        logger.info("1. Collect all metadata and source details")
+        logger.info("2. Verify EVID ID and Filename are unique")
+        logger.info("3. Validate critical values")
+        logger.info("4. Generate legally compliant summary")
+        logger.info("5. Validate unique identifiers")
+        logger.info("6. Finalize row format")
+        logger.info("7. Ensure RFC4180 compliance")
+        logger.info("=" * 80)
         
         # Find all PDF files
-        pdf_files = sorted(self.base_path.glob(pattern))
-        print(f"\nFound {len(pdf_files)} documents to process")
-        
-        # Process each document with sequential IDs
-        for idx, filepath in enumerate(pdf_files, start=1):
-            evid_id = 100000 + idx
-            id_num = 200000 + idx
-            file_number = 5000 + idx
-            
-            evidence_data = self.process_document(
-                filepath, evid_id, id_num, file_number
+        documents = self._find_documents(pattern)
+        logger.info(f"\nFound {len(documents)} documents to process")
+        
+        # Assign sequential IDs up front so documents can be built independently
+        tasks = [
+            (filepath, 100000 + idx, 200000 + idx, 5000 + idx, None, st)
+            for idx, (filepath, st) in enumerate(documents, start=1)
+        ]
+        
+        workers = self.workers or os.cpu_count() or 1
+        if workers > 1 and len(tasks) > 1:
+            # Build rows in worker processes, one task at a time and largest
+            # files first so the biggest files don't end up as a serial tail
+            by_size = sorted(
+                tasks,
+                key=lambda task: task[5].st_size if task[5] is not None else 0,
+                reverse=True
             )
-            
-            if evidence_data:
-                self.evidence_items.append(evidence_data)
-        
-        print("\n" + "=" * 80)
-        print(f"Processing complete: {len(self.evidence_items)} valid rows generated")
-        print(f"Skipped: {len(pdf_files) - len(self.evidence_items)} rows (failed validation)")
-        print("=" * 80)
+            # Rows finish out of order; hold each one only until every row
+            # before it in EVID ID order has been validated
+            ready: Dict[int, Dict] = {}
+            next_index = 0
+            # Leave max_workers unset by default so the executor applies its
+            # own platform limits (e.g. at most 61 processes on Windows)
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(str(self.base_path), self.include_sha512,
+                          logger.getEffectiveLevel())
+            ) as executor:
+                for future in as_completed(
+                    [executor.submit(_build_evidence_row, task) for task in by_size]
+                ):
+                    evidence_data = future.result()
+                    ready[evidence_data["EVID ID"]] = evidence_data
+                    while next_index < len(tasks) and tasks[next_index][1] in ready:
+                        evidence_data = ready.pop(tasks[next_index][1])
+                        next_index += 1
+                        if self.accept_evidence_row(evidence_data, ids_generated=True):
+                            self.add_evidence_row(evidence_data)
+        else:
+            for filepath, evid_id, id_num, file_number, _, st in tasks:
+                evidence_data = self.process_document(
+                    filepath, evid_id, id_num, file_number, st=st,
+                    ids_generated=True
+                )
+                
+                if evidence_data:
+                    self.add_evidence_row(evidence_data)
+        
+        logger.info("\n" + "=" * 80)
+        logger.info(f"Processing complete: {len(self)} valid rows generated")
+        logger.info(f"Skipped: {len(documents) - len(self)} rows (failed validation)")
+        logger.info("=" * 80)
     
     def write_csv(self, output_path: str) -> None:
         """
@@ -508,29 +836,58 @@ class EvidenceRegister:
         Args:
             output_path: Path to output CSV file
         """
-        print(f"\nWriting CSV output to: {output_path}")
+        logger.info(f"\nWriting CSV output to: {output_path}")
+        
+        # Rows as tuples in column order
+        rows = zip(*(self.columns[col] for col in self.CSV_COLUMNS))
         
-        # Sort by EVID ID (ascending)
-        sorted_items = sorted(self.evidence_items, key=lambda x: int(x["EVID ID"]))
+        # process_all_documents appends rows in ascending EVID ID order, so
+        # only sort if rows were added some other way
+        evid_ids = self.columns["EVID ID"]
+        if any(a > b for a, b in zip(evid_ids, evid_ids[1:])):
+            rows = sorted(rows, key=operator.itemgetter(self.CSV_COLUMNS.index("EVID ID")))
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(
-                csvfile, 
-                fieldnames=self.CSV_COLUMNS,
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(
+                csvfile,
                 quoting=csv.QUOTE_MINIMAL,
                 lineterminator='\n'
             )
             
             # Write header
-            writer.writeheader()
+            writer.writerow(self.CSV_COLUMNS)
             
             # Write rows
-            for item in sorted_items:
-                writer.writerow(item)
+            writer.writerows(rows)
         
-        print(f"✓ Successfully wrote {len(sorted_items)} rows to {output_path}")
-        print(f"✓ CSV is RFC4180 compliant with {len(self.CSV_COLUMNS)} columns")
-        print(f"✓ Rows sorted by ascending EVID ID")
+        logger.info(f"✓ Successfully wrote {len(self)} rows to {output_path}")
+        logger.info(f"✓ CSV is RFC4180 compliant with {len(self.CSV_COLUMNS)} columns")
+        logger.info("✓ Rows sorted by ascending EVID ID")
+
+
+# Per-process register used by process_all_documents' worker pool
+_worker_register: Optional[EvidenceRegister] = None
+
+
+def _init_worker(base_path: str, include_sha512: bool, log_level: int) -> None:
+    """
+    Create the register used by this worker process.
+    
+    Logging is configured here as well, since workers started with spawn
+    or forkserver don't inherit the parent's logging setup.
+    """
+    global _worker_register
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(log_level)
+    _worker_register = EvidenceRegister(
+        base_path=base_path, workers=1, include_sha512=include_sha512
+    )
+
+
+def _build_evidence_row(task: Tuple) -> Dict:
+    """Build one evidence row in a worker process."""
+    return _worker_register.build_evidence_row(*task)
 
 
 def main():
@@ -550,6 +907,12 @@ Examples:
   
   # Process with custom pattern
   python evidence_register.py -d /path/to/pdfs -p "*.PDF" -o evidence_output.csv
+  
+  # Include SHA512 hashes alongside SHA256
+  python evidence_register.py -d /path/to/pdfs -o evidence_output.csv --sha512
+  
+  # Show per-document progress
+  python evidence_register.py -d /path/to/pdfs -o evidence_output.csv -v
         """
     )
     
@@ -571,18 +934,70 @@ Examples:
         help='Output CSV file path (default: EVIDENCE_REGISTER_OUTPUT.csv)'
     )
     
+    def positive_int(value: str) -> int:
+        """Parse a strictly positive integer command-line value."""
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+        return number
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=positive_int,
+        default=None,
+        help='Number of worker processes; 1 processes and hashes documents '
+             'one at a time in-process (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--sha512',
+        action='store_true',
+        help='Also compute SHA512 hashes (default: SHA256 only)'
+    )
+    
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Check EVID ID, ID and file_number uniqueness for every row'
+    )
+    
+    parser.add_argument(
+        '-v', '--verbose',
+        action='count',
+        default=0,
+        help='Show progress (-v) or per-document processing steps (-vv)'
+    )
+    
     args = parser.parse_args()
     
+    if args.verbose >= 2:
+        level = logging.DEBUG
+    elif args.verbose == 1:
+        level = logging.INFO
+    else:
+        level = logging.WARNING
+    logging.basicConfig(level=level, format="%(message)s")
+    
     # Initialize and run evidence register
-    register = EvidenceRegister(base_path=args.directory)
+    register = EvidenceRegister(
+        base_path=args.directory, strict=args.strict, workers=args.jobs,
+        include_sha512=args.sha512
+    )
     register.process_all_documents(pattern=args.pattern)
     register.write_csv(args.output)
     
     print("\n" + "=" * 80)
     print("EVIDENCE REGISTER SYSTEM - COMPLETE")
     print("=" * 80)
-    print("\nOutput ready for legal proceedings.")
-    print("All documents authenticated with SHA256/SHA512 hashes.")
+    print(f"\n{len(register)} evidence rows written to {args.output}")
+    print("Output ready for legal proceedings.")
+    if args.sha512:
+        print("All documents authenticated with SHA256/SHA512 hashes.")
+    else:
+        print("All documents authenticated with SHA256 hashes.")
     print("CSV complies with RFC4180 standard.")
     print("\nNext steps:")
     print("1. Review output CSV for accuracy")
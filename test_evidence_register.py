@@ -5,420 +5,488 @@ Test suite for Evidence Register System
 Tests validation, processing, and output compliance for the evidence register.
 """
 
-import unittest
-import tempfile
-import shutil
 import csv
+import functools
+import hashlib
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest import mock
+
+import pytest
+
+import evidence_register
 from evidence_register import EvidenceRegister
 
 
-class TestEvidenceRegister(unittest.TestCase):
-    """Test cases for Evidence Register System."""
+# Canonical valid row; validation tests override only the field under test.
+_BASE_ROW = {
+    "EVID ID": 100001,
+    "Filename": "test.pdf",
+    "Date Formatted": "2024-10-16",
+    "Subject": "Test",
+    "Message ID": "",
+    "Domain": "",
+    "Email Address": "",
+    "File Size (KB)": 100,
+    "SHA256": "abc123",
+    "SHA512": "def456",
+    "file_category": "Document",
+    "Raw URL": "",
+    "storage_path": "Root",
+    "ID": 200001,
+    "file_number": 5001,
+    "Modified (A)": "2024-10-16T10:00:00",
+    "Modified (B)": "2024-10-16T10:00:00",
+    "Fully detail clean OCR": "Test summary"
+}
+
+
+@pytest.fixture(scope="module")
+def shared_register():
+    """Register shared by tests that don't mutate it."""
+    return EvidenceRegister()
+
+
+@pytest.fixture(scope="module")
+def ocr_summary(shared_register):
+    """Summary generated once for all OCR summary checks."""
+    return shared_register.generate_ocr_summary(
+        filename="test-document.pdf",
+        file_size=100,
+        date_formatted="2024-10-16",
+        subject="Test Document",
+        category="Legal",
+        message_id="test@example.com",
+        email="test@example.com",
+        domain="example.com",
+        sha256="abc123def456",
+        sha512="ghi789jkl012",
+        storage_path="Root",
+        evid_id=100001,
+        modified_a="2024-10-16T10:00:00"
+    )
+
+
+def create_test_file(base_path: Path, filename: str, content: bytes = b"Test content") -> Path:
+    """Create a test file with given content."""
+    filepath = base_path / filename
+    filepath.write_bytes(content)
+    return filepath
+
+
+@pytest.fixture(scope="class")
+def written_csv(tmp_path_factory):
+    """Process two documents and write the CSV once for the output checks."""
+    base_path = tmp_path_factory.mktemp("written_csv")
+    create_test_file(base_path, "241016-document1.pdf", b"Content 1")
+    create_test_file(base_path, "250225-document2.pdf", b"Content 2")
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    register = EvidenceRegister(base_path=base_path)
+    register.process_all_documents()
     
-    def create_test_file(self, filename: str, content: bytes = b"Test content") -> Path:
-        """Create a test file with given content."""
-        filepath = self.test_path / filename
-        filepath.write_bytes(content)
-        return filepath
+    output_path = base_path / "output.csv"
+    register.write_csv(str(output_path))
+    return output_path
+
+
+class TestPureLogic:
+    """Test cases for parsing, categorization, summary and validation logic."""
     
-    def test_extract_date_from_filename(self):
+    @pytest.mark.parametrize("filename,expected", [
+        ("241016-test-document.pdf", "2024-10-16"),
+        ("250225-receipt.pdf", "2025-02-25"),
+        ("nodatehere.pdf", ""),
+        ("241301-document.pdf", ""),  # out-of-range month
+    ])
+    def test_extract_date_from_filename(self, shared_register, filename, expected):
         """Test date extraction from filename."""
-        register = EvidenceRegister()
-        
-        # Test valid date
-        date = register.extract_date_from_filename("241016-test-document.pdf")
-        self.assertEqual(date, "2024-10-16")
-        
-        # Test another valid date
-        date = register.extract_date_from_filename("250225-receipt.pdf")
-        self.assertEqual(date, "2025-02-25")
-        
-        # Test no date
-        date = register.extract_date_from_filename("nodatehere.pdf")
-        self.assertEqual(date, "")
+        assert shared_register.extract_date_from_filename(filename) == expected
     
-    def test_extract_message_id(self):
+    @pytest.mark.parametrize("filename,expected", [
+        ("250207 - Welcome - test@example.com.pdf", "test@example.com"),
+        ("250207 - Subject - bNDbx@geopod-ismtpd-9.pdf", "bNDbx@geopod-ismtpd-9"),
+        ("241016-document.pdf", ""),
+    ])
+    def test_extract_message_id(self, shared_register, filename, expected):
         """Test Message ID extraction from filename."""
-        register = EvidenceRegister()
-        
-        # Test with message ID
-        msg_id = register.extract_message_id(
-            "250207 - Welcome - test@example.com.pdf"
-        )
-        self.assertEqual(msg_id, "test@example.com")
-        
-        # Test complex message ID
-        msg_id = register.extract_message_id(
-            "250207 - Subject - bNDbx@geopod-ismtpd-9.pdf"
-        )
-        self.assertEqual(msg_id, "bNDbx@geopod-ismtpd-9")
-        
-        # Test no message ID
-        msg_id = register.extract_message_id("241016-document.pdf")
-        self.assertEqual(msg_id, "")
+        assert shared_register.extract_message_id(filename) == expected
     
-    def test_extract_domain_and_email(self):
+    @pytest.mark.parametrize("message_id,expected", [
+        ("test@example.com", ("example.com", "test@example.com")),
+        ("msg@mail.example.co.uk", ("mail.example.co.uk", "msg@mail.example.co.uk")),
+        ("", ("", "")),
+    ])
+    def test_extract_domain_and_email(self, shared_register, message_id, expected):
         """Test domain and email extraction from Message ID."""
-        register = EvidenceRegister()
-        
-        # Test valid message ID
-        domain, email = register.extract_domain_and_email("test@example.com")
-        self.assertEqual(domain, "example.com")
-        self.assertEqual(email, "test@example.com")
-        
-        # Test complex domain
-        domain, email = register.extract_domain_and_email("msg@mail.example.co.uk")
-        self.assertEqual(domain, "mail.example.co.uk")
-        self.assertEqual(email, "msg@mail.example.co.uk")
-        
-        # Test no message ID
-        domain, email = register.extract_domain_and_email("")
-        self.assertEqual(domain, "")
-        self.assertEqual(email, "")
+        assert shared_register.extract_domain_and_email(message_id) == expected
     
-    def test_extract_subject(self):
+    @pytest.mark.parametrize("filename,expected", [
+        ("241016 - Contract Agreement.pdf", "Contract Agreement"),
+        ("250225 - Receipt - test@example.com.pdf", "Receipt"),
+        ("simple-document.pdf", "simple-document"),
+    ])
+    def test_extract_subject(self, shared_register, filename, expected):
         """Test subject extraction from filename."""
-        register = EvidenceRegister()
-        
-        # Test with date prefix
-        subject = register.extract_subject("241016 - Contract Agreement.pdf")
-        self.assertEqual(subject, "Contract Agreement")
-        
-        # Test with message ID suffix
-        subject = register.extract_subject("250225 - Receipt - test@example.com.pdf")
-        self.assertEqual(subject, "Receipt")
-        
-        # Test simple filename
-        subject = register.extract_subject("simple-document.pdf")
-        self.assertEqual(subject, "simple-document")
+        assert shared_register.extract_subject(filename) == expected
     
-    def test_categorize_document(self):
+    @pytest.mark.parametrize("filename,subject,expected", [
+        ("Receipt # 85835.pdf", "Receipt", "Receipt"),
+        ("rental-agreement.pdf", "Agreement", "Legal"),
+        ("VCAT-order.pdf", "VCAT order", "VCAT Document"),
+        ("doc.pdf", "Maintenance Request", "Maintenance"),
+        # Subject-only keyword in filename is ignored
+        ("payment.pdf", "Unknown", "Document"),
+        # Priority when several keywords match
+        ("Notice of entry.pdf", "Repair order", "Court Order"),
+        ("unknown.pdf", "Unknown", "Document"),
+    ])
+    def test_categorize_document(self, shared_register, filename, subject, expected):
         """Test document categorization."""
-        register = EvidenceRegister()
-        
-        # Test receipt
-        category = register.categorize_document("Receipt # 85835.pdf", "Receipt")
-        self.assertEqual(category, "Receipt")
+        assert shared_register.categorize_document(filename, subject) == expected
+    
+    def test_validate_evidence_row_success(self, shared_register):
+        """Test successful evidence row validation."""
+        register = shared_register
         
-        # Test agreement
-        category = register.categorize_document("rental-agreement.pdf", "Agreement")
-        self.assertEqual(category, "Legal")
+        evidence_data = dict(_BASE_ROW)
         
-        # Test VCAT
-        category = register.categorize_document("VCAT-order.pdf", "VCAT order")
-        self.assertEqual(category, "VCAT Document")
+        is_valid, error_msg = register.validate_evidence_row(evidence_data)
+        assert is_valid
+        assert error_msg == ""
+    
+    @pytest.mark.parametrize("field,value,seen_attr,expected", [
+        ("EVID ID", None, None, "Missing EVID ID"),
+        ("EVID ID", 100001, "seen_evid_ids", "Duplicate EVID ID"),
+        ("Filename", "test.pdf", "seen_filenames", "Duplicate Filename"),
+        ("EVID ID", "not-a-number", None, "Invalid EVID ID"),
+    ], ids=["missing_evid_id", "duplicate_evid_id", "duplicate_filename",
+            "invalid_evid_id_type"])
+    def test_validate_evidence_row_errors(self, field, value, seen_attr, expected):
+        """Test validation fails for missing, duplicate and invalid fields."""
+        register = EvidenceRegister()
+        if seen_attr:
+            getattr(register, seen_attr).add(value)
         
-        # Test maintenance
-        category = register.categorize_document("doc.pdf", "Maintenance Request")
-        self.assertEqual(category, "Maintenance")
+        evidence_data = {**_BASE_ROW, field: value}
         
-        # Test default
-        category = register.categorize_document("unknown.pdf", "Unknown")
-        self.assertEqual(category, "Document")
+        is_valid, error_msg = register.validate_evidence_row(evidence_data)
+        assert not is_valid
+        assert expected in error_msg
+    
+    @pytest.mark.parametrize("expected", [
+        "test-document.pdf",
+        "100 KB",
+        "2024-10-16",
+        "Test Document",
+        "Legal",
+        "test@example.com",
+        "abc123def456",
+        "ghi789jkl012",
+        "Root",
+        "authenticated",
+        "legal proceedings",
+    ])
+    def test_generate_ocr_summary(self, ocr_summary, expected):
+        """Test OCR summary contains key information."""
+        assert expected in ocr_summary
+
+
+class TestDiskIO:
+    """Test cases for hashing, document processing and CSV output on disk."""
     
     def test_compute_hashes(self):
         """Test SHA256/SHA512 hash computation."""
-        register = EvidenceRegister(base_path=self.test_dir)
+        register = EvidenceRegister(include_sha512=True)
         
-        # Create test file with known content
+        # Hash known content from memory
         content = b"Test content for hashing"
-        filepath = self.create_test_file("test.pdf", content)
-        
-        sha256, sha512 = register.compute_hashes(filepath)
         
-        # Verify hashes are not empty
-        self.assertTrue(len(sha256) > 0)
-        self.assertTrue(len(sha512) > 0)
-        
-        # Verify hash lengths (hex strings)
-        self.assertEqual(len(sha256), 64)  # 256 bits = 64 hex chars
-        self.assertEqual(len(sha512), 128)  # 512 bits = 128 hex chars
+        expected = (
+            hashlib.sha256(content).hexdigest(),
+            hashlib.sha512(content).hexdigest(),
+        )
         
-        # Verify hashes are consistent
-        sha256_2, sha512_2 = register.compute_hashes(filepath)
-        self.assertEqual(sha256, sha256_2)
-        self.assertEqual(sha512, sha512_2)
+        assert register.compute_hashes(io.BytesIO(content)) == expected
     
-    def test_validate_evidence_row_success(self):
-        """Test successful evidence row validation."""
-        register = EvidenceRegister()
+    @pytest.mark.slow
+    def test_compute_hashes_streaming(self, tmp_path):
+        """Test streamed hashing of files too large to memory-map."""
+        register = EvidenceRegister(base_path=tmp_path, include_sha512=True)
         
-        evidence_data = {
-            "EVID ID": 100001,
-            "Filename": "test.pdf",
-            "Date Formatted": "2024-10-16",
-            "Subject": "Test",
-            "Message ID": "",
-            "Domain": "",
-            "Email Address": "",
-            "File Size (KB)": 100,
-            "SHA256": "abc123",
-            "SHA512": "def456",
-            "file_category": "Document",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "2024-10-16T10:00:00",
-            "Modified (B)": "2024-10-16T10:00:00",
-            "Fully detail clean OCR": "Test summary"
-        }
+        content = b"x" * (3 * evidence_register.HASH_BUFFER_SIZE + 7)
+        filepath = create_test_file(tmp_path, "large.pdf", content)
         
-        is_valid, error_msg = register.validate_evidence_row(evidence_data)
-        self.assertTrue(is_valid)
-        self.assertEqual(error_msg, "")
+        with mock.patch.object(evidence_register, "MMAP_HASH_LIMIT", 0):
+            sha256, sha512 = register.compute_hashes(filepath)
+        
+        assert sha256 == hashlib.sha256(content).hexdigest()
+        assert sha512 == hashlib.sha512(content).hexdigest()
     
-    def test_validate_evidence_row_missing_evid_id(self):
-        """Test validation fails with missing EVID ID."""
+    def test_compute_hashes_sha256_only(self):
+        """Test SHA512 is skipped unless requested."""
         register = EvidenceRegister()
         
-        evidence_data = {
-            "EVID ID": None,
-            "Filename": "test.pdf",
-            "Date Formatted": "2024-10-16",
-            "Subject": "Test",
-            "Message ID": "",
-            "Domain": "",
-            "Email Address": "",
-            "File Size (KB)": 100,
-            "SHA256": "abc123",
-            "SHA512": "def456",
-            "file_category": "Document",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "2024-10-16T10:00:00",
-            "Modified (B)": "2024-10-16T10:00:00",
-            "Fully detail clean OCR": "Test summary"
-        }
+        content = b"Test content for hashing"
+        
+        sha256, sha512 = register.compute_hashes(io.BytesIO(content))
         
-        is_valid, error_msg = register.validate_evidence_row(evidence_data)
-        self.assertFalse(is_valid)
-        self.assertIn("Missing EVID ID", error_msg)
+        assert sha256 == hashlib.sha256(content).hexdigest()
+        assert sha512 == ""
     
-    def test_validate_evidence_row_duplicate_evid_id(self):
-        """Test validation fails with duplicate EVID ID."""
-        register = EvidenceRegister()
-        register.seen_evid_ids.add(100001)
+    def test_batch_hash(self, tmp_path):
+        """Test parallel hashing matches per-file hashing."""
+        register = EvidenceRegister(base_path=tmp_path)
         
-        evidence_data = {
-            "EVID ID": 100001,
-            "Filename": "test.pdf",
-            "Date Formatted": "2024-10-16",
-            "Subject": "Test",
-            "Message ID": "",
-            "Domain": "",
-            "Email Address": "",
-            "File Size (KB)": 100,
-            "SHA256": "abc123",
-            "SHA512": "def456",
-            "file_category": "Document",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "2024-10-16T10:00:00",
-            "Modified (B)": "2024-10-16T10:00:00",
-            "Fully detail clean OCR": "Test summary"
-        }
+        paths = [
+            create_test_file(tmp_path, "small.pdf", b"a"),
+            create_test_file(tmp_path, "large.pdf", b"b" * 100000),
+            create_test_file(tmp_path, "empty.pdf", b""),
+        ]
         
-        is_valid, error_msg = register.validate_evidence_row(evidence_data)
-        self.assertFalse(is_valid)
-        self.assertIn("Duplicate EVID ID", error_msg)
-    
-    def test_validate_evidence_row_duplicate_filename(self):
-        """Test validation fails with duplicate filename."""
-        register = EvidenceRegister()
-        register.seen_filenames.add("test.pdf")
-        
-        evidence_data = {
-            "EVID ID": 100001,
-            "Filename": "test.pdf",
-            "Date Formatted": "2024-10-16",
-            "Subject": "Test",
-            "Message ID": "",
-            "Domain": "",
-            "Email Address": "",
-            "File Size (KB)": 100,
-            "SHA256": "abc123",
-            "SHA512": "def456",
-            "file_category": "Document",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "2024-10-16T10:00:00",
-            "Modified (B)": "2024-10-16T10:00:00",
-            "Fully detail clean OCR": "Test summary"
-        }
+        hash_map = register.batch_hash(paths)
         
-        is_valid, error_msg = register.validate_evidence_row(evidence_data)
-        self.assertFalse(is_valid)
-        self.assertIn("Duplicate Filename", error_msg)
+        assert set(hash_map) == set(paths)
+        for path in paths:
+            assert hash_map[path] == register.compute_hashes(path)
     
-    def test_generate_ocr_summary(self):
-        """Test OCR summary generation."""
-        register = EvidenceRegister()
-        
-        evidence_data = {
-            "EVID ID": 100001,
-            "Filename": "test-document.pdf",
-            "Date Formatted": "2024-10-16",
-            "Subject": "Test Document",
-            "Message ID": "test@example.com",
-            "Domain": "example.com",
-            "Email Address": "test@example.com",
-            "File Size (KB)": 100,
-            "SHA256": "abc123def456",
-            "SHA512": "ghi789jkl012",
-            "file_category": "Legal",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "2024-10-16T10:00:00",
-            "Modified (B)": "2024-10-16T10:00:00",
-            "Fully detail clean OCR": ""
-        }
-        
-        summary = register.generate_ocr_summary(evidence_data)
-        
-        # Verify summary contains key information
-        self.assertIn("test-document.pdf", summary)
-        self.assertIn("100 KB", summary)
-        self.assertIn("2024-10-16", summary)
-        self.assertIn("Test Document", summary)
-        self.assertIn("Legal", summary)
-        self.assertIn("test@example.com", summary)
-        self.assertIn("abc123def456", summary)
-        self.assertIn("ghi789jkl012", summary)
-        self.assertIn("Root", summary)
-        self.assertIn("authenticated", summary)
-        self.assertIn("legal proceedings", summary)
+    def test_batch_hash_respects_workers(self, tmp_path):
+        """Test a single worker hashes files on a single thread."""
+        register = EvidenceRegister(base_path=tmp_path, workers=1)
+        paths = [create_test_file(tmp_path, "doc.pdf", b"a")]
+        
+        with mock.patch.object(
+            evidence_register, "ThreadPoolExecutor",
+            wraps=evidence_register.ThreadPoolExecutor
+        ) as executor:
+            register.batch_hash(paths)
+        
+        executor.assert_called_once_with(max_workers=1)
     
-    def test_process_document_integration(self):
+    @pytest.mark.slow
+    def test_process_document_integration(self, tmp_path):
         """Integration test for document processing."""
-        register = EvidenceRegister(base_path=self.test_dir)
+        register = EvidenceRegister(base_path=tmp_path, include_sha512=True)
         
         # Create a test PDF file
         content = b"PDF test content for integration test"
-        filepath = self.create_test_file("241016-test-document.pdf", content)
+        filepath = create_test_file(tmp_path, "241016-test-document.pdf", content)
         
         # Process the document
         evidence_data = register.process_document(filepath, 100001, 200001, 5001)
         
         # Verify the result
-        self.assertIsNotNone(evidence_data)
-        self.assertEqual(evidence_data["EVID ID"], 100001)
-        self.assertEqual(evidence_data["Filename"], "241016-test-document.pdf")
-        self.assertEqual(evidence_data["Date Formatted"], "2024-10-16")
-        self.assertEqual(evidence_data["Subject"], "241016-test-document")
-        self.assertEqual(evidence_data["ID"], 200001)
-        self.assertEqual(evidence_data["file_number"], 5001)
-        self.assertTrue(len(evidence_data["SHA256"]) > 0)
-        self.assertTrue(len(evidence_data["SHA512"]) > 0)
-        self.assertTrue(len(evidence_data["Fully detail clean OCR"]) > 0)
+        assert evidence_data is not None
+        assert evidence_data["EVID ID"] == 100001
+        assert evidence_data["Filename"] == "241016-test-document.pdf"
+        assert evidence_data["Date Formatted"] == "2024-10-16"
+        assert evidence_data["Subject"] == "241016-test-document"
+        assert evidence_data["ID"] == 200001
+        assert evidence_data["file_number"] == 5001
+        assert evidence_data["SHA256"] == hashlib.sha256(content).hexdigest()
+        assert evidence_data["SHA512"] == hashlib.sha512(content).hexdigest()
+        assert len(evidence_data["Fully detail clean OCR"]) > 0
     
-    def test_csv_output_format(self):
+    @pytest.mark.slow
+    def test_csv_output_format(self, written_csv):
         """Test CSV output format compliance."""
-        register = EvidenceRegister(base_path=self.test_dir)
-        
-        # Create test files
-        self.create_test_file("241016-document1.pdf", b"Content 1")
-        self.create_test_file("250225-document2.pdf", b"Content 2")
-        
-        # Process documents
-        register.process_all_documents()
-        
-        # Write CSV
-        output_path = self.test_path / "output.csv"
-        register.write_csv(str(output_path))
-        
         # Verify CSV file exists
-        self.assertTrue(output_path.exists())
+        assert written_csv.exists()
         
         # Parse CSV and verify structure
-        with open(output_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        with open(written_csv, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
             
-            # Check we have rows
-            self.assertEqual(len(rows), 2)
+            # Header equality guarantees every column is present and in order
+            assert next(reader) == EvidenceRegister.CSV_COLUMNS
+            evid_index = EvidenceRegister.CSV_COLUMNS.index("EVID ID")
             
-            # Check all columns present
-            for row in rows:
-                self.assertEqual(len(row), 18)
-                for col in register.CSV_COLUMNS:
-                    self.assertIn(col, row)
+            # Check row widths and sorting by EVID ID
+            row_count = 0
+            previous_evid_id = None
+            for row in reader:
+                row_count += 1
+                assert len(row) == 18
+                
+                evid_id = int(row[evid_index])
+                assert previous_evid_id is None or previous_evid_id <= evid_id
+                previous_evid_id = evid_id
             
-            # Verify sorting by EVID ID
-            evid_ids = [int(row["EVID ID"]) for row in rows]
-            self.assertEqual(evid_ids, sorted(evid_ids))
+            # Check we have rows
+            assert row_count == 2
     
-    def test_column_order(self):
-        """Test that CSV columns are in the correct order."""
-        register = EvidenceRegister(base_path=self.test_dir)
+    @pytest.mark.slow
+    def test_process_all_documents_parallel(self, tmp_path):
+        """Test worker processes produce the same rows as in-process processing."""
+        create_test_file(tmp_path, "241016-document1.pdf", b"Content 1")
+        create_test_file(tmp_path, "250225 - Receipt - test@example.com.pdf", b"Content 2")
+        create_test_file(tmp_path, "250226-document3.pdf", b"Content 3")
         
-        # Create a test file
-        self.create_test_file("241016-test.pdf", b"Test")
+        serial = EvidenceRegister(base_path=tmp_path, workers=1)
+        serial.process_all_documents()
         
-        # Process and write
+        parallel = EvidenceRegister(base_path=tmp_path, workers=2)
+        parallel.process_all_documents()
+        
+        assert len(parallel.evidence_items) == 3
+        assert parallel.evidence_items == serial.evidence_items
+    
+    @pytest.mark.slow
+    def test_process_all_documents_spawn_logging(self, tmp_path, monkeypatch, capfd, caplog):
+        """Test worker processes log progress without inheriting via fork."""
+        create_test_file(tmp_path, "241016-document1.pdf", b"Content 1")
+        create_test_file(tmp_path, "250225-document2.pdf", b"Content 2")
+        
+        spawn = multiprocessing.get_context("spawn")
+        monkeypatch.setattr(
+            evidence_register, "ProcessPoolExecutor",
+            functools.partial(ProcessPoolExecutor, mp_context=spawn)
+        )
+        caplog.set_level(logging.INFO, logger=evidence_register.__name__)
+        
+        register = EvidenceRegister(base_path=tmp_path, workers=2)
+        register.process_all_documents()
+        
+        assert len(register) == 2
+        err = capfd.readouterr().err
+        assert "Processing: 241016-document1.pdf" in err
+        assert "Processing: 250225-document2.pdf" in err
+    
+    def test_evidence_items_read_only(self, tmp_path):
+        """Test evidence_items rejects mutation instead of silently dropping it."""
+        register = EvidenceRegister(base_path=tmp_path, workers=1)
+        create_test_file(tmp_path, "241016-document.pdf", b"Content")
         register.process_all_documents()
-        output_path = self.test_path / "output.csv"
+        
+        items = register.evidence_items
+        with pytest.raises(AttributeError):
+            items.append(dict(_BASE_ROW))
+        with pytest.raises(TypeError):
+            items[0]["Subject"] = "Changed"
+        
+        register.add_evidence_row(dict(_BASE_ROW))
+        assert len(register.evidence_items) == 2
+    
+    def test_add_evidence_row_rejects_mismatched_columns(self):
+        """Test a row with missing or extra columns leaves the register intact."""
+        register = EvidenceRegister()
+        register.add_evidence_row(dict(_BASE_ROW))
+        
+        missing = dict(_BASE_ROW)
+        del missing["Fully detail clean OCR"]
+        with pytest.raises(ValueError, match="missing"):
+            register.add_evidence_row(missing)
+        with pytest.raises(ValueError, match="unexpected"):
+            register.add_evidence_row({**_BASE_ROW, "Extra": ""})
+        
+        register.add_evidence_row({**_BASE_ROW, "EVID ID": 100002,
+                                   "Fully detail clean OCR": "second"})
+        assert len(register) == 2
+        assert [item["EVID ID"] for item in register.evidence_items] == [100001, 100002]
+        assert register.evidence_items[1]["Fully detail clean OCR"] == "second"
+    
+    def test_process_all_documents_skips_non_matching(self, tmp_path):
+        """Test only regular files matching the pattern are processed."""
+        register = EvidenceRegister(base_path=tmp_path, workers=1)
+        
+        create_test_file(tmp_path, "241016-document.pdf", b"Content")
+        create_test_file(tmp_path, "notes.txt", b"Notes")
+        (tmp_path / "folder.pdf").mkdir()
+        
+        register.process_all_documents()
+        
+        filenames = [item["Filename"] for item in register.evidence_items]
+        assert filenames == ["241016-document.pdf"]
+    
+    @pytest.mark.slow
+    def test_write_csv_sorts_unordered_rows(self, tmp_path):
+        """Test rows added out of order are still written by ascending EVID ID."""
+        register = EvidenceRegister(base_path=tmp_path, workers=1)
+        
+        create_test_file(tmp_path, "241016-document1.pdf", b"Content 1")
+        create_test_file(tmp_path, "250225-document2.pdf", b"Content 2")
+        register.process_all_documents()
+        for values in register.columns.values():
+            values.reverse()
+        
+        output_path = tmp_path / "output.csv"
         register.write_csv(str(output_path))
         
-        # Read and check column order
         with open(output_path, 'r', encoding='utf-8') as f:
+            evid_ids = [int(row["EVID ID"]) for row in csv.DictReader(f)]
+        assert evid_ids == [100001, 100002]
+    
+    @pytest.mark.slow
+    def test_column_order(self, written_csv):
+        """Test that CSV columns are in the correct order."""
+        # Read and check column order
+        with open(written_csv, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
             header = next(reader)
             
             # Verify exact column order
-            self.assertEqual(header, register.CSV_COLUMNS)
+            assert header == EvidenceRegister.CSV_COLUMNS
 
 
-class TestValidationRules(unittest.TestCase):
+class TestValidationRules:
     """Test validation rules and error handling."""
     
-    def test_invalid_evid_id_type(self):
-        """Test validation fails with non-integer EVID ID."""
+    def test_process_document_duplicate_filename(self, tmp_path):
+        """Test duplicate filenames are rejected without strict mode."""
         register = EvidenceRegister()
+        register.seen_filenames.add("241016-test.pdf")
         
-        evidence_data = {
-            "EVID ID": "not-a-number",
-            "Filename": "test.pdf",
-            "Date Formatted": "",
-            "Subject": "",
-            "Message ID": "",
-            "Domain": "",
-            "Email Address": "",
-            "File Size (KB)": 0,
-            "SHA256": "",
-            "SHA512": "",
-            "file_category": "Document",
-            "Raw URL": "",
-            "storage_path": "Root",
-            "ID": 200001,
-            "file_number": 5001,
-            "Modified (A)": "",
-            "Modified (B)": "",
-            "Fully detail clean OCR": ""
-        }
+        filepath = create_test_file(tmp_path, "241016-test.pdf", b"Test")
         
-        is_valid, error_msg = register.validate_evidence_row(evidence_data)
-        self.assertFalse(is_valid)
-        self.assertIn("Invalid EVID ID", error_msg)
+        evidence_data = register.process_document(filepath, 100001, 200001, 5001)
+        assert evidence_data is None
+    
+    def test_process_document_duplicate_ids(self, tmp_path):
+        """Test caller-supplied IDs are always checked for duplicates."""
+        first = create_test_file(tmp_path, "241016-first.pdf", b"First")
+        second = create_test_file(tmp_path, "241016-second.pdf", b"Second")
+        
+        register = EvidenceRegister()
+        assert register.process_document(first, 1, 1, 1) is not None
+        assert register.process_document(second, 1, 1, 1) is None
+    
+    def test_strict_mode_duplicate_evid_id(self, tmp_path):
+        """Test generated ID uniqueness is only checked in strict mode."""
+        filepath = create_test_file(tmp_path, "241016-test.pdf", b"Test")
+        
+        register = EvidenceRegister()
+        register.seen_evid_ids.add(100001)
+        assert register.process_document(
+            filepath, 100001, 200001, 5001, ids_generated=True
+        ) is not None
+        
+        register = EvidenceRegister(strict=True)
+        register.seen_evid_ids.add(100001)
+        assert register.process_document(
+            filepath, 100001, 200001, 5001, ids_generated=True
+        ) is None
+    
+    def test_generated_ids_reject_bool(self):
+        """Test booleans are not accepted as generated integer IDs."""
+        register = EvidenceRegister()
+        
+        assert not register.accept_evidence_row(
+            {**_BASE_ROW, "ID": True}, ids_generated=True
+        )
+
+    
+    @pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+    def test_jobs_must_be_positive(self, jobs, capsys):
+        """Test -j rejects non-positive values with a usage error."""
+        with mock.patch("sys.argv", ["evidence_register.py", "-j", jobs]):
+            with pytest.raises(SystemExit) as excinfo:
+                evidence_register.main()
+        
+        assert excinfo.value.code == 2
+        assert "must be a positive integer" in capsys.readouterr().err
 
 
 if __name__ == "__main__":
-    unittest.main()
+    raise SystemExit(pytest.main([__file__, "-v"]))